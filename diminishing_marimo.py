@@ -65,6 +65,14 @@ def _(app_version="0.1.0"):
     )
 
 
+@app.cell
+def _(np):
+    # Shared plot grids; they do not depend on any slider so they are built once
+    x = np.linspace(0.00001, 1, 1000)
+    x2 = np.linspace(0.001, 100, 800)
+    return x, x2
+
+
 @app.cell
 def _():
     mo.md(
@@ -92,14 +100,13 @@ def _():
 
 
 @app.cell
-def _(PowerLawDecay, a, b, go, np, p):
-    x = np.linspace(0.00001, 1, 1000)
+def _(PowerLawDecay, a, b, go, p, x):
     f = PowerLawDecay(a=a.value, p=p.value, b=b.value)
     y = f(x)
     fig = go.Figure(go.Scatter(x=x, y=y, name="power-law"))
     fig.add_hline(y=0, line_dash="dot", line_color="gray")
     fig.update_layout(
-        title=fr"Power-law<br>{f.math_str()}<br><sup>{f.params_str()}</sup>",
+        title=f.title("Power-law"),
         xaxis_title="x",
         yaxis_title="f(x)",
         yaxis_range=(-0, 100),
@@ -124,14 +131,13 @@ def _():
 
 
 @app.cell
-def _(LogGrowth, a2, b2, go, np):
-    x2 = np.linspace(0.001, 100, 800)
+def _(LogGrowth, a2, b2, go, x2):
     g = LogGrowth(a=a2.value, b=b2.value)
     y2 = g(x2)
     fig2 = go.Figure(go.Scatter(x=x2, y=y2, name="log"))
     fig2.add_vline(x=max(0.0, -b2.value), line_dash="dot", line_color="gray", annotation_text="domain start")
     fig2.update_layout(
-        title=fr"Logarithmic growth<br>{g.math_str()}<br><sup>{g.params_str()}</sup>",
+        title=g.title("Logarithmic growth"),
         xaxis_title="x",
         yaxis_title="f(x)",
         xaxis_range=(0, 100),
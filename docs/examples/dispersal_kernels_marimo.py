@@ -98,6 +98,13 @@ def _(app_version="0.1.0"):
     )
 
 
+@app.cell
+def _(np):
+    # Shared plot grid; it does not depend on any slider so it is built once
+    r_grid = np.linspace(0.0, 200.0, 800, dtype=np.float32)
+    return (r_grid,)
+
+
 @app.cell
 def _(mo):
     mo.md(
@@ -123,13 +130,12 @@ def _(mo):
 
 
 @app.cell
-def _(ExponentialKernel, go, lam_exp, mo, np):
-    r_exp = np.linspace(0.0, 200.0, 800)
-    k_exp = ExponentialKernel(lam=lam_exp.value)
-    y_exp = k_exp(r_exp)
-    fig_exp = go.Figure(go.Scatter(x=r_exp, y=y_exp, name="exponential"))
+def _(ExponentialKernel, go, lam_exp, mo, np, r_grid):
+    k_exp = ExponentialKernel(lam=lam_exp.value, dtype=np.float32)
+    y_exp = k_exp(r_grid)
+    fig_exp = go.Figure(go.Scatter(x=r_grid, y=y_exp, name="exponential"))
     fig_exp.update_layout(
-        title=fr"Exponential kernel<br>{k_exp.math_str()}<br><sup>{k_exp.params_str()}</sup>",
+        title=k_exp.title("Exponential kernel"),
         yaxis_range=[-0.10, 1],
         xaxis_title="r",
         yaxis_title="K(r)",
@@ -158,13 +164,12 @@ def _(mo):
 
 
 @app.cell
-def _(GaussianKernel, go, mo, np, sigma_gauss):
-    r_gauss = np.linspace(0.0, 200.0, 800)
-    g_gauss = GaussianKernel(sigma=sigma_gauss.value)
-    y_gauss = g_gauss(r_gauss)
-    fig_gauss = go.Figure(go.Scatter(x=r_gauss, y=y_gauss, name="gaussian"))
+def _(GaussianKernel, go, mo, np, r_grid, sigma_gauss):
+    g_gauss = GaussianKernel(sigma=sigma_gauss.value, dtype=np.float32)
+    y_gauss = g_gauss(r_grid)
+    fig_gauss = go.Figure(go.Scatter(x=r_grid, y=y_gauss, name="gaussian"))
     fig_gauss.update_layout(
-        title=fr"Gaussian kernel<br>{g_gauss.math_str()}<br><sup>{g_gauss.params_str()}</sup>",
+        title=g_gauss.title("Gaussian kernel"),
         yaxis_range=[-0.10, 1],
         xaxis_title="r",
         yaxis_title="K(r)",
@@ -188,13 +193,12 @@ def _(mo):
 
 
 @app.cell
-def _(PowerLawKernel, alpha_pl, go, mo, np, p_pl):
-    r_pl = np.linspace(0.0, 200.0, 800)
-    pl_kernel = PowerLawKernel(alpha=alpha_pl.value, p=p_pl.value)
-    y_pl = pl_kernel(r_pl)
-    fig_pl = go.Figure(go.Scatter(x=r_pl, y=y_pl, name="power-law"))
+def _(PowerLawKernel, alpha_pl, go, mo, np, p_pl, r_grid):
+    pl_kernel = PowerLawKernel(alpha=alpha_pl.value, p=p_pl.value, dtype=np.float32)
+    y_pl = pl_kernel(r_grid)
+    fig_pl = go.Figure(go.Scatter(x=r_grid, y=y_pl, name="power-law"))
     fig_pl.update_layout(
-        title=fr"Power-law kernel<br>{pl_kernel.math_str()}<br><sup>{pl_kernel.params_str()}</sup>",
+        title=pl_kernel.title("Power-law kernel"),
         yaxis_range=[-0.10, 1],
         xaxis_title="r",
         yaxis_title="K(r)",
@@ -218,13 +222,12 @@ def _(mo):
 
 
 @app.cell
-def _(RectangularHyperbolaKernel, alpha_rh, go, mo, np, p_rh):
-    r_rh = np.linspace(0.0, 200.0, 800)
-    rh_kernel = RectangularHyperbolaKernel(alpha=alpha_rh.value, p=p_rh.value)
-    y_rh = rh_kernel(r_rh)
-    fig_rh = go.Figure(go.Scatter(x=r_rh, y=y_rh, name="rectangular hyperbola"))
+def _(RectangularHyperbolaKernel, alpha_rh, go, mo, np, p_rh, r_grid):
+    rh_kernel = RectangularHyperbolaKernel(alpha=alpha_rh.value, p=p_rh.value, dtype=np.float32)
+    y_rh = rh_kernel(r_grid)
+    fig_rh = go.Figure(go.Scatter(x=r_grid, y=y_rh, name="rectangular hyperbola"))
     fig_rh.update_layout(
-        title=fr"Rectangular hyperbola kernel<br>{rh_kernel.math_str()}<br><sup>{rh_kernel.params_str()}</sup>",
+        title=rh_kernel.title("Rectangular hyperbola kernel"),
         yaxis_range=[-0.10, 1],
         xaxis_title="r",
         yaxis_title="K(r)",
@@ -248,13 +251,12 @@ def _(mo):
 
 
 @app.cell
-def _(ExpPowerKernel, go, lam_ep, mo, np, q_ep):
-    r_ep = np.linspace(0.0, 200.0, 800)
-    ep_kernel = ExpPowerKernel(lam=lam_ep.value, q=q_ep.value)
-    y_ep = ep_kernel(r_ep)
-    fig_ep = go.Figure(go.Scatter(x=r_ep, y=y_ep, name="exp-power"))
+def _(ExpPowerKernel, go, lam_ep, mo, np, q_ep, r_grid):
+    ep_kernel = ExpPowerKernel(lam=lam_ep.value, q=q_ep.value, dtype=np.float32)
+    y_ep = ep_kernel(r_grid)
+    fig_ep = go.Figure(go.Scatter(x=r_grid, y=y_ep, name="exp-power"))
     fig_ep.update_layout(
-        title=fr"Exponential-power kernel<br>{ep_kernel.math_str()}<br><sup>{ep_kernel.params_str()}</sup>",
+        title=ep_kernel.title("Exponential-power kernel"),
         yaxis_range=[-0.10, 1],
         xaxis_title="r",
         yaxis_title="K(r)",
@@ -21,8 +21,22 @@ from .dispersal_kernels import (
 	kernel_rectangular_hyperbola,
 )
 from .log_growth import LogGrowth, log_growth
+from .md_docs_parser import precompile as _precompile
 from .power_law_decay import PowerLawDecay, power_law_decay
 
+# Render the notebooks' function docs once per interpreter, not per cell run
+_precompile(
+	[
+		kernel_exponential,
+		kernel_gaussian,
+		kernel_powerlaw,
+		kernel_rectangular_hyperbola,
+		kernel_exppower,
+		log_growth,
+		power_law_decay,
+	]
+)
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -0,0 +1,89 @@
+"""Array API implementations of the dispersal kernels.
+
+Used when ``distance`` is a non-NumPy array (e.g. ``torch.Tensor`` or
+``cupy.ndarray``) so the computation runs in that array's own library and on
+its device instead of forcing a host copy. NumPy inputs never reach this
+module; they keep the NumPy paths in
+:mod:`interactive_functions.dispersal_kernels`.
+
+``array_api_compat`` is optional: without it, only arrays that implement
+``__array_namespace__`` natively (e.g. CuPy) are dispatched.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+try:
+    from array_api_compat import array_namespace
+except ImportError:  # Optional; needed for arrays such as torch.Tensor
+    array_namespace = None
+
+__all__ = [
+    "namespace",
+    "full_nan",
+    "exponential",
+    "gaussian",
+    "powerlaw",
+    "rectangular_hyperbola",
+    "exppower",
+]
+
+
+def namespace(x: Any) -> Any | None:
+    """Return the array namespace of ``x``, or ``None`` for NumPy and plain Python inputs."""
+    if isinstance(x, (np.ndarray, np.generic)):
+        return None
+    if array_namespace is not None:
+        try:
+            xp = array_namespace(x)
+        except TypeError:  # scalars, lists and other non-array inputs
+            return None
+    elif hasattr(x, "__array_namespace__"):
+        xp = x.__array_namespace__()
+    else:
+        return None
+    return None if xp is np or xp.__name__ == "array_api_compat.numpy" else xp
+
+
+def _asarray(xp: Any, x: Any, dtype: DTypeLike) -> Any:
+    return xp.asarray(x, dtype=getattr(xp, np.dtype(dtype).name))
+
+
+def _nan_where(xp: Any, valid: Any, y: Any) -> Any:
+    return xp.where(valid, y, xp.full_like(y, xp.nan))
+
+
+def full_nan(xp: Any, x: Any, dtype: DTypeLike) -> Any:
+    return xp.full_like(_asarray(xp, x, dtype), xp.nan)
+
+
+def exponential(xp: Any, distance: Any, lam: float, dtype: DTypeLike) -> Any:
+    r = _asarray(xp, distance, dtype)
+    return xp.exp(-r / lam)
+
+
+def gaussian(xp: Any, distance: Any, sigma: float, dtype: DTypeLike) -> Any:
+    r = _asarray(xp, distance, dtype)
+    t = r / sigma
+    return xp.exp(-(t * t))
+
+
+def powerlaw(xp: Any, distance: Any, alpha: float, p: float, dtype: DTypeLike) -> Any:
+    r = _asarray(xp, distance, dtype)
+    base = 1.0 + r / alpha
+    return _nan_where(xp, base > 0.0, xp.pow(base, -p))
+
+
+def rectangular_hyperbola(xp: Any, distance: Any, alpha: float, p: float, dtype: DTypeLike) -> Any:
+    r = _asarray(xp, distance, dtype)
+    denom = 1.0 + xp.pow(r / alpha, p)
+    return _nan_where(xp, denom > 0.0, 1.0 / denom)
+
+
+def exppower(xp: Any, distance: Any, lam: float, q: float, dtype: DTypeLike) -> Any:
+    r = _asarray(xp, distance, dtype)
+    return xp.exp(-xp.pow(r / lam, q))
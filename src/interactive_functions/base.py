@@ -24,6 +24,10 @@ def _value(v: Any) -> float:
     """
 
     raw = getattr(v, "value", v)
+    if isinstance(raw, float):
+        return raw
+    if isinstance(raw, int):
+        return float(raw)
     try:
         return float(raw)  # type: ignore[arg-type]
     except (TypeError, ValueError) as exc:
@@ -41,14 +45,31 @@ class BaseFunction(ABC):
     - ``MATH_TEMPLATE`` (ClassVar[str]): a symbolic LaTeX string using variable
       names (e.g., ``$f(x) = a \cdot \ln(x + b)$``) — not a format string.
 
-    The default ``__call__`` delegates to ``fn(x, **parameters)``. ``math_str``
+    Subclasses may also override ``options`` to pass non-parameter keyword
+    arguments (e.g. ``dtype``) through to ``fn``.
+
+    The default ``__call__`` delegates to ``fn(x, **parameters, **options)``;
+    subclasses may override it to call ``fn`` directly on their fields. ``math_str``
     returns the symbolic expression unchanged, while ``params_str`` renders a
     separate compact string of parameter values like ``"a=1.00, b=2.00"``.
     """
 
+    # No per-instance __dict__; subclasses are expected to be slotted dataclasses.
+    __slots__ = ()
+
     # Symbolic LaTeX template for the function (with variable names).
     MATH_TEMPLATE: ClassVar[str] = ""
 
+    def __post_init__(self) -> None:
+        """Resolve widget-like parameter values to floats once, at construction.
+
+        Called by dataclass subclasses (including frozen ones), so evaluation
+        can use the bound fields directly without going through ``_value``.
+        """
+
+        for k, v in self.parameters.items():
+            object.__setattr__(self, k, _value(v))
+
     @property
     @abstractmethod
     def fn(self) -> Callable[..., NDArray[np.float64]]:
@@ -59,12 +80,21 @@ class BaseFunction(ABC):
     def parameters(self) -> Mapping[str, Any]:
         """Return a mapping of parameter names to values (numbers or widget-like)."""
 
+    @property
+    def options(self) -> Mapping[str, Any]:
+        """Return extra keyword arguments for ``fn`` that are not parameters."""
+
+        return {}
+
     def __call__(self, x: ArrayLike) -> NDArray[np.float64]:
         """Evaluate the function for array-like ``x`` with bound parameters."""
 
-        # Extract primitives in case values are widget-like (have .value)
-        params = {k: _value(v) for k, v in self.parameters.items()}
-        return self.fn(x, **params)
+        return self.fn(x, **self._resolved_params(), **self.options)
+
+    def _resolved_params(self) -> dict[str, float]:
+        """Return ``parameters`` with widget-like values extracted to floats."""
+
+        return {k: _value(v) for k, v in self.parameters.items()}
 
     def math_str(self) -> str:
         """Return the symbolic LaTeX string for the function.
@@ -88,6 +118,17 @@ class BaseFunction(ABC):
 
         items: list[str] = []
         for k, v in self.parameters.items():
-            val = _value(v)
-            items.append(f"{k}={val:.{precision}f}")
+            items.append(f"{k}={_value(v):.{precision}f}")
         return sep.join(items)
+
+    def title(self, name: str) -> str:
+        """Return a plot title with ``name``, the symbolic math and parameter values.
+
+        Args:
+            name: Human-readable function name shown on the first line.
+
+        Returns:
+            A ``<br>``-separated title for Plotly figures.
+        """
+
+        return f"{name}<br>{self.math_str()}<br><sup>{self.params_str()}</sup>"
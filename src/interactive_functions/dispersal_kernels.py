@@ -2,7 +2,8 @@ r"""Dispersal kernels and parameter-bound helper classes.
 
 Provides NumPy-vectorized implementations of common dispersal kernels and
 small dataclass wrappers that bind parameters for convenient reuse in plots
-and interactive notebooks.
+and interactive notebooks. Non-NumPy arrays (e.g. PyTorch or CuPy) are
+evaluated with their own array library via the array API standard.
 
 Kernels included:
 - Exponential (Laplace in 2D): ``K(r) = exp(-r / \lambda)``
@@ -14,13 +15,15 @@ Kernels included:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, ClassVar, Mapping
 
 import numpy as np
-from numpy.typing import ArrayLike, NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 
+from . import _kernels_xp
 from .base import BaseFunction
+from .power_law_decay import _neg_power
 
 __all__ = [
     "kernel_exponential",
@@ -36,12 +39,15 @@ __all__ = [
 ]
 
 
-def _full_nan_like(x: ArrayLike) -> NDArray[np.float64]:
-    x_arr = np.asarray(x, dtype=float)
-    return np.full_like(x_arr, np.nan, dtype=np.float64)
+def _full_nan_like(x: ArrayLike, dtype: DTypeLike = np.float64) -> NDArray[np.floating]:
+    xp = _kernels_xp.namespace(x)
+    if xp is not None:
+        return _kernels_xp.full_nan(xp, x, dtype)
+    x_arr = np.asarray(x, dtype=dtype)
+    return np.full_like(x_arr, np.nan)
 
 
-def kernel_exponential(distance: ArrayLike, lam: float) -> NDArray[np.float64]:
+def kernel_exponential(distance: ArrayLike, lam: float, *, dtype: DTypeLike = np.float64) -> NDArray[np.floating]:
     r"""
     ## Exponential kernel (Laplace in 2D).
 
@@ -52,6 +58,7 @@ def kernel_exponential(distance: ArrayLike, lam: float) -> NDArray[np.float64]:
     Args:
         distance: Radial distance ``r`` from the source. Array-like.
         lam: Positive scale parameter (``> 0``).
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         Array of shape like ``distance`` with values in ``(0, 1]`` where
@@ -64,14 +71,18 @@ def kernel_exponential(distance: ArrayLike, lam: float) -> NDArray[np.float64]:
         array([1.    , 0.2865, 0.0821, 0.0235, 0.0067])
     """
     if lam <= 0:
-        return _full_nan_like(distance)
-    r = np.asarray(distance, dtype=float)
+        return _full_nan_like(distance, dtype)
+    xp = _kernels_xp.namespace(distance)
+    if xp is not None:
+        return _kernels_xp.exponential(xp, distance, lam, dtype)
+    r = np.asarray(distance, dtype=dtype)
+    # One scratch buffer for the whole chain; ``r`` may alias the caller's array
     with np.errstate(over="ignore", invalid="ignore"):
-        y = np.exp(-r / lam)
-    return y.astype(np.float64, copy=False)
+        y = np.divide(r, -lam, out=np.empty_like(r))
+        return np.exp(y, out=y)
 
 
-def kernel_gaussian(distance: ArrayLike, sigma: float) -> NDArray[np.float64]:
+def kernel_gaussian(distance: ArrayLike, sigma: float, *, dtype: DTypeLike = np.float64) -> NDArray[np.floating]:
     r"""
     ## Gaussian kernel.
 
@@ -82,20 +93,28 @@ def kernel_gaussian(distance: ArrayLike, sigma: float) -> NDArray[np.float64]:
     Args:
         distance: Radial distance ``r`` from the source. Array-like.
         sigma: Positive scale (standard deviation-like) parameter (``> 0``).
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         Array like ``distance`` with values in ``(0, 1]`` where defined;
         ``NaN`` if ``sigma <= 0``.
     """
     if sigma <= 0:
-        return _full_nan_like(distance)
-    r = np.asarray(distance, dtype=float)
+        return _full_nan_like(distance, dtype)
+    xp = _kernels_xp.namespace(distance)
+    if xp is not None:
+        return _kernels_xp.gaussian(xp, distance, sigma, dtype)
+    r = np.asarray(distance, dtype=dtype)
     with np.errstate(over="ignore", invalid="ignore"):
-        y = np.exp(-np.square(r / sigma))
-    return y.astype(np.float64, copy=False)
+        y = np.divide(r, sigma, out=np.empty_like(r))
+        np.square(y, out=y)
+        np.negative(y, out=y)
+        return np.exp(y, out=y)
 
 
-def kernel_powerlaw(distance: ArrayLike, alpha: float, p: float) -> NDArray[np.float64]:
+def kernel_powerlaw(
+    distance: ArrayLike, alpha: float, p: float, *, dtype: DTypeLike = np.float64
+) -> NDArray[np.floating]:
     r"""
     ## Power-law kernel.
 
@@ -107,24 +126,32 @@ def kernel_powerlaw(distance: ArrayLike, alpha: float, p: float) -> NDArray[np.f
         distance: Radial distance ``r`` from the source. Array-like.
         alpha: Positive scale parameter controlling the shoulder (``> 0``).
         p: Positive tail exponent (``> 0``). Larger ``p`` yields shorter tails.
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         Array like ``distance`` with values in ``(0, 1]`` where ``1 + r/alpha > 0``;
         ``NaN`` if ``alpha <= 0`` or ``p <= 0``.
     """
     if alpha <= 0 or p <= 0:
-        return _full_nan_like(distance)
-    r = np.asarray(distance, dtype=float)
-    base = 1.0 + r / alpha
-    with np.errstate(over="ignore", invalid="ignore"):
-        y = np.power(base, -p)
-    y = np.where(base > 0.0, y, np.nan)
-    return y.astype(np.float64, copy=False)
+        return _full_nan_like(distance, dtype)
+    xp = _kernels_xp.namespace(distance)
+    if xp is not None:
+        return _kernels_xp.powerlaw(xp, distance, alpha, p, dtype)
+    r = np.asarray(distance, dtype=dtype)
+    y = np.divide(r, alpha, out=np.empty_like(r))
+    y += 1.0
+    invalid = ~(y > 0.0)
+    # Same unmasked (base)^-p passes as power_law_decay; the invalid lanes are
+    # overwritten with NaN afterwards.
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        _neg_power(y, p)
+    np.copyto(y, np.nan, where=invalid)
+    return y
 
 
 def kernel_rectangular_hyperbola(
-    distance: ArrayLike, alpha: float, p: float
-) -> NDArray[np.float64]:
+    distance: ArrayLike, alpha: float, p: float, *, dtype: DTypeLike = np.float64
+) -> NDArray[np.floating]:
     r"""
     ## Rectangular hyperbola kernel.
 
@@ -137,28 +164,34 @@ def kernel_rectangular_hyperbola(
         distance: Radial distance ``r`` from the source. Array-like.
         alpha: Positive scale parameter controlling the shoulder (``> 0``).
         p: Positive shape parameter (``> 0``). Larger ``p`` steepens decay.
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         Array like ``distance`` with values in ``(0, 1]`` where defined;
         ``NaN`` if ``alpha <= 0`` or ``p <= 0``.
     """
     if alpha <= 0 or p <= 0:
-        return _full_nan_like(distance)
-    r = np.asarray(distance, dtype=float)
-    ratio = r / alpha
+        return _full_nan_like(distance, dtype)
+    xp = _kernels_xp.namespace(distance)
+    if xp is not None:
+        return _kernels_xp.rectangular_hyperbola(xp, distance, alpha, p, dtype)
+    r = np.asarray(distance, dtype=dtype)
+    y = np.divide(r, alpha, out=np.empty_like(r))
+    # Unmasked passes are cheaper than ``where=`` ufuncs; the (rare) invalid
+    # lanes are patched afterwards.
     with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
-        denom = 1.0 + np.power(ratio, p)
-        y = np.divide(
-            1.0,
-            denom,
-            out=np.empty_like(ratio, dtype=np.float64),
-            where=denom != 0.0,
-        )
-    y = np.where(denom > 0.0, y, np.nan)
-    return y.astype(np.float64, copy=False)
-
-
-def kernel_exppower(distance: ArrayLike, lam: float, q: float) -> NDArray[np.float64]:
+        np.power(y, p, out=y)
+        y += 1.0
+        invalid = ~(y > 0.0)
+        np.reciprocal(y, out=y)
+    if invalid.any():
+        y[invalid] = np.nan
+    return y
+
+
+def kernel_exppower(
+    distance: ArrayLike, lam: float, q: float, *, dtype: DTypeLike = np.float64
+) -> NDArray[np.floating]:
     r"""
     ## Exponential-power (Weibull) kernel.
 
@@ -171,20 +204,31 @@ def kernel_exppower(distance: ArrayLike, lam: float, q: float) -> NDArray[np.flo
         lam: Positive scale parameter (``> 0``).
         q: Positive shape parameter (``> 0``). ``q=2`` approximates Gaussian,
             ``q=1`` reduces to Exponential.
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         Array like ``distance`` with values in ``(0, 1]`` where defined;
         ``NaN`` if ``lam <= 0`` or ``q <= 0``.
     """
     if lam <= 0 or q <= 0:
-        return _full_nan_like(distance)
-    r = np.asarray(distance, dtype=float)
+        return _full_nan_like(distance, dtype)
+    # Common shapes reduce to cheaper kernels without the generic power
+    if q == 1.0:
+        return kernel_exponential(distance, lam, dtype=dtype)
+    if q == 2.0:
+        return kernel_gaussian(distance, lam, dtype=dtype)
+    xp = _kernels_xp.namespace(distance)
+    if xp is not None:
+        return _kernels_xp.exppower(xp, distance, lam, q, dtype)
+    r = np.asarray(distance, dtype=dtype)
     with np.errstate(over="ignore", invalid="ignore"):
-        y = np.exp(-np.power(r / lam, q))
-    return y.astype(np.float64, copy=False)
+        y = np.divide(r, lam, out=np.empty_like(r))
+        np.power(y, q, out=y)
+        np.negative(y, out=y)
+        return np.exp(y, out=y)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExponentialKernel(BaseFunction):
     r"""Exponential kernel ``K(r) = exp(-r / \lambda)``.
 
@@ -192,9 +236,11 @@ class ExponentialKernel(BaseFunction):
 
     Args:
         lam: Positive scale parameter. Default ``10.0``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
     """
 
     lam: float = 10.0
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     MATH_TEMPLATE: ClassVar[str] = r"$K(r) = \exp\!\left(-\dfrac{r}{\lambda}\right)$"
 
@@ -202,12 +248,19 @@ class ExponentialKernel(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:
         return kernel_exponential
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return kernel_exponential(x, self.lam, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"lam": self.lam}
 
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GaussianKernel(BaseFunction):
     r"""Gaussian kernel ``K(r) = exp(-(r / \sigma)^2)``.
 
@@ -215,9 +268,11 @@ class GaussianKernel(BaseFunction):
 
     Args:
         sigma: Positive scale parameter. Default ``10.0``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
     """
 
     sigma: float = 10.0
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     MATH_TEMPLATE: ClassVar[str] = r"$K(r) = \exp\!\left(-\left(\dfrac{r}{\sigma}\right)^2\right)$"
 
@@ -225,12 +280,19 @@ class GaussianKernel(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:
         return kernel_gaussian
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return kernel_gaussian(x, self.sigma, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"sigma": self.sigma}
 
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerLawKernel(BaseFunction):
     r"""Power-law kernel ``K(r) = (1 + r / \alpha)^{-p}``.
 
@@ -239,10 +301,12 @@ class PowerLawKernel(BaseFunction):
     Args:
         alpha: Positive scale parameter (shoulder). Default ``10.0``.
         p: Positive tail exponent. Default ``2.0``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
     """
 
     alpha: float = 10.0
     p: float = 2.0
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     MATH_TEMPLATE: ClassVar[str] = r"$K(r) = \left(1 + \dfrac{r}{\alpha}\right)^{-p}$"
 
@@ -250,12 +314,52 @@ class PowerLawKernel(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:
         return kernel_powerlaw
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return kernel_powerlaw(x, self.alpha, self.p, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"alpha": self.alpha, "p": self.p}
 
-
-@dataclass(frozen=True)
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
+
+    @classmethod
+    def evaluate_grid(cls, r: ArrayLike, alphas: ArrayLike, ps: ArrayLike) -> NDArray[np.float64]:
+        """Evaluate the kernel for every ``(alpha, p)`` pair in one broadcast pass.
+
+        Useful for parameter sweeps (e.g. animating over ``p``) without
+        building one kernel instance per parameter value.
+
+        Args:
+            r: 1-D radial distances.
+            alphas: 1-D scale parameters.
+            ps: 1-D tail exponents.
+
+        Returns:
+            Array of shape ``(len(alphas), len(ps), len(r))`` matching
+            :func:`kernel_powerlaw` for each pair; ``NaN`` where
+            ``1 + r/alpha <= 0`` or the pair is invalid.
+        """
+        r_arr = np.asarray(r, dtype=np.float64).ravel()[None, None, :]
+        alpha_arr = np.asarray(alphas, dtype=np.float64).ravel()[:, None, None]
+        p_arr = np.asarray(ps, dtype=np.float64).ravel()[None, :, None]
+        # Rows with alpha <= 0 stay NaN, which also excludes them from ``valid``
+        scaled = np.full(np.broadcast_shapes(r_arr.shape, alpha_arr.shape), np.nan)
+        np.divide(r_arr, alpha_arr, out=scaled, where=alpha_arr > 0.0)
+        base = np.add(scaled, 1.0, out=scaled)
+        # log(base) is shared by every p, so only the exp runs over the full grid
+        log_base = np.log(base, out=np.full_like(base, np.nan), where=base > 0.0)
+        valid = (base > 0.0) & (p_arr > 0.0)
+        out = np.full(valid.shape, np.nan)
+        np.multiply(-p_arr, log_base, out=out, where=valid)
+        with np.errstate(over="ignore"):
+            np.exp(out, out=out, where=valid)
+        return out
+
+
+@dataclass(frozen=True, slots=True)
 class ExpPowerKernel(BaseFunction):
     r"""
     ## Exponential-power kernel 
@@ -267,10 +371,12 @@ class ExpPowerKernel(BaseFunction):
     Args:
         lam: Positive scale parameter. Default ``10.0``.
         q: Positive shape parameter. Default ``1.5``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
     """
 
     lam: float = 10.0
     q: float = 1.5
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     MATH_TEMPLATE: ClassVar[str] = r"$K(r) = \exp\!\left(-\left(\dfrac{r}{\lambda}\right)^{q}\right)$"
 
@@ -278,12 +384,19 @@ class ExpPowerKernel(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:
         return kernel_exppower
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return kernel_exppower(x, self.lam, self.q, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"lam": self.lam, "q": self.q}
 
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RectangularHyperbolaKernel(BaseFunction):
     r"""Rectangular hyperbola kernel ``K(r) = 1 / [1 + (r / \alpha)^p]``.
 
@@ -292,10 +405,12 @@ class RectangularHyperbolaKernel(BaseFunction):
     Args:
         alpha: Positive scale parameter. Default ``10.0``.
         p: Positive shape parameter. Default ``2.0``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
     """
 
     alpha: float = 10.0
     p: float = 2.0
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     MATH_TEMPLATE: ClassVar[str] = r"$K(r) = \dfrac{1}{1 + \left(\dfrac{r}{\alpha}\right)^{p}}$"
 
@@ -303,6 +418,13 @@ class RectangularHyperbolaKernel(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:
         return kernel_rectangular_hyperbola
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return kernel_rectangular_hyperbola(x, self.alpha, self.p, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"alpha": self.alpha, "p": self.p}
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
@@ -43,15 +43,20 @@ def log_growth(x: ArrayLike, a: float, b: float) -> NDArray[np.float64]:
         log_growth(x, a=1.5, b=1.0).round(4)
         ```
     """
-    x_arr = np.asarray(x, dtype=float)
-    domain = x_arr + b
+    x_arr = np.asarray(x, dtype=np.float64)
+    # Compute in place in a single buffer; ``x_arr`` may alias the caller's array
+    y = np.add(x_arr, b, out=np.empty_like(x_arr))
+    invalid = ~(y > 0.0)
+    # Unmasked ufuncs are cheaper than ``where=`` ones; the invalid lanes are
+    # overwritten with NaN afterwards.
     with np.errstate(divide="ignore", invalid="ignore"):
-        y = a * np.log(domain)
-    y = np.where(domain > 0.0, y, np.nan)
-    return y.astype(np.float64, copy=False)
+        np.log(y, out=y)
+        y *= a
+    np.copyto(y, np.nan, where=invalid)
+    return y
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogGrowth(BaseFunction):
     """Logarithmic growth function ``f(x) = a * ln(x + b)``.
 
@@ -86,6 +91,9 @@ class LogGrowth(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:  # -> callable
         return log_growth
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.float64]:
+        return log_growth(x, self.a, self.b)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"a": self.a, "b": self.b}
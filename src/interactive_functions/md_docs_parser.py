@@ -1,61 +1,82 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any
+import io
+from functools import lru_cache
+from typing import Any, Iterable
 
 from docstring_parser import DocstringStyle, parse
 
 
+# ``id(obj) -> (obj, markdown)``; holding ``obj`` keeps its id from being
+# reused (e.g. after a module reload) while the entry exists. See ``precompile``.
+_DOC_CACHE: dict[int, tuple[Any, str]] = {}
+
+
 def doc_to_markdown(obj: Any) -> str:
 	"""Render an object's Google/NumPy docstring to Markdown.
 
 	Produces level-2 headers (##) for sections and bullet lists for params.
 	"""
-	doc = inspect.getdoc(obj) or ""
+	cached = _DOC_CACHE.get(id(obj))
+	if cached is not None and cached[0] is obj:
+		return cached[1]
+	return _render(inspect.getdoc(obj) or "")
+
+
+def precompile(objs: Iterable[Any]) -> None:
+	"""Render the docstrings of ``objs`` ahead of time.
+
+	Intended for long-lived objects (e.g. module-level functions); the cache
+	keeps a reference to each one.
+
+	Args:
+		objs: Objects whose docstrings should be rendered.
+	"""
+	for obj in objs:
+		_DOC_CACHE[id(obj)] = (obj, _render(inspect.getdoc(obj) or ""))
+
+
+@lru_cache(maxsize=128)
+def _render(doc: str) -> str:
+	"""Render docstring text to Markdown; cached as docstrings are static."""
 	ds = parse(doc, style=DocstringStyle.AUTO)
 
-	lines: list[str] = []
+	buf = io.StringIO()
 
 	if ds.short_description:
-		lines.append(ds.short_description.strip())
-		lines.append("")
+		buf.write(f"{ds.short_description.strip()}\n\n")
 	if ds.long_description:
-		lines.append(ds.long_description.strip())
-		lines.append("")
+		buf.write(f"{ds.long_description.strip()}\n\n")
 
 	if ds.params:
-		lines.append("## Args")
+		buf.write("## Args\n")
 		for p in ds.params:
 			desc = (p.description or "").strip()
 			type_prefix = f"({p.type_name}) " if p.type_name else ""
-			lines.append(f"- {p.arg_name}: {type_prefix}{desc}")
-		lines.append("")
+			buf.write(f"- {p.arg_name}: {type_prefix}{desc}\n")
+		buf.write("\n")
 
 	if ds.returns:
-		lines.append("## Returns")
 		ret_desc = (ds.returns.description or "").strip()
 		if ds.returns.type_name:
-			lines.append(f"- {ds.returns.type_name}: {ret_desc}")
+			buf.write(f"## Returns\n- {ds.returns.type_name}: {ret_desc}\n\n")
 		else:
-			lines.append(f"- {ret_desc}")
-		lines.append("")
+			buf.write(f"## Returns\n- {ret_desc}\n\n")
 
 	if ds.raises:
-		lines.append("## Raises")
+		buf.write("## Raises\n")
 		for r in ds.raises:
 			tn = r.type_name or "Exception"
 			desc = (r.description or "").strip()
-			lines.append(f"- {tn}: {desc}")
-		lines.append("")
+			buf.write(f"- {tn}: {desc}\n")
+		buf.write("\n")
 
 	if ds.examples:
-		lines.append("## Examples")
+		buf.write("## Examples\n")
 		for ex in ds.examples:
 			code = (ex.description or "").strip()
 			if code:
-				lines.append("```python")
-				lines.append(code)
-				lines.append("```")
-				lines.append("")
+				buf.write(f"```python\n{code}\n```\n\n")
 
-	return "\n".join(lines).rstrip()
\ No newline at end of file
+	return buf.getvalue().rstrip()
\ No newline at end of file
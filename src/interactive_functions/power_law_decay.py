@@ -7,18 +7,44 @@ and interactive notebooks.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, ClassVar, Mapping
 
 import numpy as np
-from numpy.typing import ArrayLike, NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 from .base import BaseFunction
 
 __all__ = ["power_law_decay", "PowerLawDecay"]
 
 
-def power_law_decay(x: ArrayLike, a: float, p: float, b: float) -> NDArray[np.float64]:
+def _neg_power(d: NDArray[np.floating], p: float) -> NDArray[np.floating]:
+    """Raise ``d`` to ``-p`` in place.
+
+    Common exponents use dedicated SIMD ufuncs; the rest use
+    ``exp(-p * log(d))`` rather than NumPy's scalar ``pow``. Lanes with
+    ``d <= 0`` are left to the caller to mask.
+    """
+    if p == 1.0:
+        np.reciprocal(d, out=d)
+    elif p == 2.0:
+        np.square(d, out=d)
+        np.reciprocal(d, out=d)
+    elif p == 0.5:
+        np.sqrt(d, out=d)
+        np.reciprocal(d, out=d)
+    elif p == 0.0:
+        d.fill(1.0)  # exp(-0 * log(inf)) would be NaN
+    elif p != -1.0:
+        np.log(d, out=d)
+        np.multiply(d, -p, out=d)
+        np.exp(d, out=d)
+    return d
+
+
+def power_law_decay(
+    x: ArrayLike, a: float, p: float, b: float, *, dtype: DTypeLike = np.float64
+) -> NDArray[np.floating]:
     """
     # Power-law decay:
     $f(x) = a * (x + b)^{-p}$
@@ -32,6 +58,7 @@ def power_law_decay(x: ArrayLike, a: float, p: float, b: float) -> NDArray[np.fl
         a: Positive scale factor controlling the overall height of the curve.
         p: Positive decay exponent; larger values decay faster.
         b: Horizontal shift. The valid domain satisfies ``x + b > 0``.
+        dtype: Floating-point dtype of the computation and output. Default ``np.float64``.
 
     Returns:
         A NumPy array ``y`` of the same shape as ``x`` with
@@ -44,15 +71,20 @@ def power_law_decay(x: ArrayLike, a: float, p: float, b: float) -> NDArray[np.fl
         power_law_decay(x, a=2.0, p=1.5, b=0.0).round(4)
         ```
     """
-    x_arr = np.asarray(x, dtype=float)
-    domain = x_arr + b
-    with np.errstate(divide="ignore", invalid="ignore"):
-        y = a * np.power(domain, -p)
-    y = np.where(domain > 0.0, y, np.nan)
-    return y.astype(np.float64, copy=False)
-
-
-@dataclass(frozen=True)
+    x_arr = np.asarray(x, dtype=dtype)
+    # Single buffer for the whole chain; ``x_arr`` may alias the caller's array
+    y = np.add(x_arr, b, out=np.empty_like(x_arr))
+    invalid = ~(y > 0.0)
+    # Unmasked ufuncs are cheaper than ``where=`` ones; the invalid lanes are
+    # overwritten with NaN afterwards.
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        _neg_power(y, p)
+        y *= a
+    np.copyto(y, np.nan, where=invalid)
+    return y
+
+
+@dataclass(frozen=True, slots=True)
 class PowerLawDecay(BaseFunction):
     """Power-law decay function ``f(x) = a * (x + b)^{-p}``.
 
@@ -64,10 +96,12 @@ class PowerLawDecay(BaseFunction):
         a: Positive scale factor controlling the curve height. Default ``1.0``.
         p: Positive decay exponent; larger values decay faster. Default ``1.0``.
         b: Horizontal shift. Domain requires ``x + b > 0``. Default ``0.0``.
+        dtype: Floating-point dtype of the output. Default ``np.float64``.
 
     Notes:
         - Values where ``x + b <= 0`` return ``NaN`` for safe plotting.
-        - Computation is fully vectorized and uses ``float64`` outputs.
+        - Computation is fully vectorized and uses ``float64`` outputs unless
+          ``dtype`` says otherwise.
 
     Example:
         ```python
@@ -83,6 +117,7 @@ class PowerLawDecay(BaseFunction):
     a: float = 1.0
     p: float = 1.0
     b: float = 0.0
+    dtype: DTypeLike = field(default=np.float64, repr=False)
 
     # Symbolic template; parameters shown separately via params_str()
     MATH_TEMPLATE: ClassVar[str] = r"$f(x) = a \\cdot (x + b)^{-p}$"
@@ -91,6 +126,13 @@ class PowerLawDecay(BaseFunction):
     def fn(self) -> Callable[..., NDArray[np.float64]]:  # -> callable
         return power_law_decay
 
+    def __call__(self, x: ArrayLike) -> NDArray[np.floating]:
+        return power_law_decay(x, self.a, self.p, self.b, dtype=self.dtype)
+
     @property
     def parameters(self) -> Mapping[str, Any]:
         return {"a": self.a, "p": self.p, "b": self.b}
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return {"dtype": self.dtype}
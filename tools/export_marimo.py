@@ -11,7 +11,9 @@ Run locally before `mkdocs build`, or wire it into CI as a pre-build step.
 
 from __future__ import annotations
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -27,19 +29,28 @@ def export_marimo_apps(root: Path) -> None:
         print("No .py files found under docs/notebooks; nothing to export.")
         return
 
-    for in_file in py_files:
-        out_file = in_file.with_suffix(".html")
-        cmd = [
-            "python",
-            "-m",
-            "marimo",
-            "export",
-            str(in_file),
-            "--to",
-            str(out_file),
-        ]
-        print(f"Exporting {in_file} -> {out_file}")
-        subprocess.run(cmd, check=True)
+    # Each export is an independent `python -m marimo` process, so run them
+    # concurrently; threads are enough since the work happens in subprocesses.
+    with ThreadPoolExecutor(max_workers=min(len(py_files), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(_export_one, in_file) for in_file in py_files]
+        for future in futures:
+            future.result()  # re-raise any CalledProcessError
+
+
+def _export_one(in_file: Path) -> None:
+    """Export a single Marimo app next to its source file."""
+    out_file = in_file.with_suffix(".html")
+    cmd = [
+        "python",
+        "-m",
+        "marimo",
+        "export",
+        str(in_file),
+        "--to",
+        str(out_file),
+    ]
+    print(f"Exporting {in_file} -> {out_file}")
+    subprocess.run(cmd, check=True)
 
 
 if __name__ == "__main__":
@@ -6,12 +6,46 @@ This script checks that all required assets are in place for successful
 Pyodide deployment of marimo notebooks.
 """
 
+import mmap
+import re
 import sys
 from pathlib import Path
 from urllib.parse import urljoin
 import zipfile
 
 
+# Patterns every marimo file must contain for Pyodide compatibility
+MARIMO_CHECKS = [
+    ('emscripten check', 'sys.platform == "emscripten"'),
+    ('wheel_url construction', 'wheel_url = urljoin('),
+    ('micropip install', 'await micropip.install('),
+    ('interactive_functions import', 'import interactive_functions')
+]
+
+# One bytes alternation (group ``c<i>`` per check) so each file is scanned in a
+# single pass, directly over an mmap without decoding it
+_MARIMO_CHECKS_RE = re.compile(
+    b'|'.join(b'(?P<c%d>%s)' % (i, re.escape(pattern.encode())) for i, (_, pattern) in enumerate(MARIMO_CHECKS))
+)
+
+
+def _find_marimo_checks(filepath):
+    """Return the group names of the MARIMO_CHECKS patterns found in ``filepath``."""
+    seen = set()
+    with open(filepath, 'rb') as f:
+        if filepath.stat().st_size == 0:  # mmap cannot map an empty file
+            return seen
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for match in _MARIMO_CHECKS_RE.finditer(mm):
+                seen.add(match.lastgroup)
+                if len(seen) == len(MARIMO_CHECKS):
+                    break
+        finally:
+            mm.close()
+    return seen
+
+
 def check_wheel_file():
     """Check that the wheel file exists and is valid."""
     wheel_path = Path("docs/assets/wheels/interactive_functions-latest-py3-none-any.whl")
@@ -26,10 +60,16 @@ def check_wheel_file():
     # Validate wheel structure
     try:
         with zipfile.ZipFile(wheel_path, 'r') as z:
-            files = z.namelist()
-            # Check for key files
-            has_init = any('__init__.py' in f for f in files)
-            has_metadata = any('METADATA' in f for f in files)
+            # Check for key files in a single pass, stopping once both are seen
+            has_init = has_metadata = False
+            for info in z.infolist():
+                name = info.filename
+                if '__init__.py' in name:
+                    has_init = True
+                if 'METADATA' in name:
+                    has_metadata = True
+                if has_init and has_metadata:
+                    break
             
             if has_init and has_metadata:
                 print("   ✅ Wheel structure is valid")
@@ -55,22 +95,14 @@ def check_marimo_files():
             all_good = False
             continue
             
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
         # Check for required patterns
-        checks = [
-            ('emscripten check', 'sys.platform == "emscripten"'),
-            ('wheel_url construction', 'wheel_url = urljoin('),
-            ('micropip install', 'await micropip.install('),
-            ('interactive_functions import', 'import interactive_functions')
-        ]
+        seen = _find_marimo_checks(filepath)
         
         file_ok = True
         print(f"✅ Checking {filename}:")
         
-        for check_name, pattern in checks:
-            if pattern in content:
+        for i, (check_name, _) in enumerate(MARIMO_CHECKS):
+            if f'c{i}' in seen:
                 print(f"   ✅ {check_name}")
             else:
                 print(f"   ❌ {check_name}")